@@ -1,69 +1,155 @@
 """
 Shared AWS service clients for DataMorph agents.
 Provides reusable clients for Bedrock, S3, Secrets Manager, and DynamoDB.
+
+boto3 and botocore.config are imported on first client creation rather than
+at module import, so cold starts only pay for them when a client is used.
 """
-import boto3
+import codecs
 import json
-from typing import Dict, Any, Optional
-from botocore.exceptions import ClientError
-from botocore.config import Config as BotocoreConfig
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from botocore.config import Config as BotocoreConfig
+
+# orjson is optional; it serializes straight to bytes and is much faster.
+# Payloads orjson rejects but stdlib json accepts (e.g. ints over 64 bits)
+# fall back to json, so both paths accept the same inputs. The one output
+# difference: NaN/Infinity become null (valid JSON) instead of bare NaN.
+#
+# Parsing arbitrary payloads stays on stdlib json because orjson silently
+# turns integers over 64 bits into floats; orjson only parses Bedrock stream
+# events, whose schema is fixed.
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(obj).encode()
+    
+    _event_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _event_loads = json.loads
+
+
+@lru_cache(maxsize=None)
+def _default_config() -> "BotocoreConfig":
+    """Shared client config: wide keep-alive pool, adaptive retries, bounded timeouts."""
+    from botocore.config import Config as BotocoreConfig
+    
+    return BotocoreConfig(
+        max_pool_connections=50,
+        retries={'mode': 'adaptive', 'max_attempts': 3},
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=60,
+        user_agent_extra='datamorph/1.0'
+    )
 
 
 class AWSClients:
-    """Singleton class for AWS service clients."""
+    """
+    Cache of AWS service clients.
     
-    _instance = None
-    _clients = {}
+    Use the module-level ``aws_clients`` instance; call make_aws_clients()
+    only when an independent cache is needed (e.g. in tests).
+    """
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(AWSClients, cls).__new__(cls)
-        return cls._instance
+    def __init__(self):
+        self._clients: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+    
+    def _get(
+        self,
+        service: str,
+        region: str,
+        config: Optional["BotocoreConfig"] = None,
+        key: Optional[Tuple[Any, ...]] = None
+    ):
+        """Get or create a client for the given service and region."""
+        key = key or (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    import boto3
+                    
+                    client = boto3.client(
+                        service,
+                        region_name=region,
+                        config=config or _default_config()
+                    )
+                    self._clients[key] = client
+        return client
     
     def get_bedrock_client(self, region: str = "us-east-1"):
         """Get or create Bedrock Runtime client."""
-        if "bedrock" not in self._clients:
-            self._clients["bedrock"] = boto3.client(
-                "bedrock-runtime",
-                region_name=region
-            )
-        return self._clients["bedrock"]
+        return self._get("bedrock-runtime", region)
     
     def get_s3_client(self, region: str = "us-east-1"):
         """Get or create S3 client."""
-        if "s3" not in self._clients:
-            self._clients["s3"] = boto3.client("s3", region_name=region)
-        return self._clients["s3"]
+        return self._get("s3", region)
     
     def get_secrets_manager_client(self, region: str = "us-east-1"):
         """Get or create Secrets Manager client."""
-        if "secrets" not in self._clients:
-            self._clients["secrets"] = boto3.client(
-                "secretsmanager",
-                region_name=region
-            )
-        return self._clients["secrets"]
+        return self._get("secretsmanager", region)
     
     def get_dynamodb_client(self, region: str = "us-east-1"):
         """Get or create DynamoDB client."""
-        if "dynamodb" not in self._clients:
-            self._clients["dynamodb"] = boto3.client(
-                "dynamodb",
-                region_name=region
-            )
-        return self._clients["dynamodb"]
+        return self._get("dynamodb", region)
     
     def get_lambda_client(self, region: str = "us-east-1"):
         """Get or create Lambda client."""
-        if "lambda" not in self._clients:
-            self._clients["lambda"] = boto3.client("lambda", region_name=region)
-        return self._clients["lambda"]
+        return self._get("lambda", region)
     
     def get_glue_client(self, region: str = "us-east-1"):
         """Get or create Glue client."""
-        if "glue" not in self._clients:
-            self._clients["glue"] = boto3.client("glue", region_name=region)
-        return self._clients["glue"]
+        return self._get("glue", region)
+    
+    def get_long_lambda_client(self, region: str = "us-east-1", read_timeout: int = 900):
+        """Get or create Lambda client for long-running synchronous invocations."""
+        key = ("lambda", region, read_timeout)
+        client = self._clients.get(key)
+        if client is None:
+            from botocore.config import Config as BotocoreConfig
+            
+            # Glue Executor can take 80-130 seconds, so the default read timeout
+            # matches the Lambda max timeout. No retries: invocations are not idempotent.
+            lambda_config = _default_config().merge(BotocoreConfig(
+                read_timeout=read_timeout,
+                connect_timeout=10,
+                retries={'max_attempts': 1, 'mode': 'standard'},
+                max_pool_connections=20
+            ))
+            client = self._get("lambda", region, config=lambda_config, key=key)
+        return client
+
+
+def make_aws_clients() -> AWSClients:
+    """
+    Create a new client cache independent of the shared ``aws_clients``.
+    
+    Returns:
+        New AWSClients instance
+    """
+    return AWSClients()
+
+
+# Global client cache instance
+aws_clients = AWSClients()
+
+# Shared pool for background S3 uploads; PutObject is network-bound and
+# releases the GIL, so threads overlap well up to the client's pool size
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="s3-upload")
 
 
 def invoke_bedrock(
@@ -71,10 +157,11 @@ def invoke_bedrock(
     model_id: str = "us.anthropic.claude-sonnet-4-5-20250929-v1:0",
     max_tokens: int = 4096,
     temperature: float = 0.5,
-    region: str = "us-east-1"
+    region: str = "us-east-1",
+    stream_callback: Optional[Callable[[str], None]] = None
 ) -> str:
     """
-    Invoke AWS Bedrock with Claude model.
+    Invoke AWS Bedrock with Claude model, streaming the response.
     
     Args:
         prompt: The prompt to send to the model
@@ -82,6 +169,8 @@ def invoke_bedrock(
         max_tokens: Maximum tokens in response
         temperature: Model temperature
         region: AWS region
+        stream_callback: Optional callable invoked with each text fragment
+            as it arrives
         
     Returns:
         Response text from the model
@@ -89,7 +178,7 @@ def invoke_bedrock(
     Raises:
         ClientError: If Bedrock invocation fails
     """
-    client = AWSClients().get_bedrock_client(region)
+    client = aws_clients.get_bedrock_client(region)
     
     native_request = {
         "anthropic_version": "bedrock-2023-05-31",
@@ -103,13 +192,31 @@ def invoke_bedrock(
         ]
     }
     
-    request = json.dumps(native_request)
+    request = _json_dumps(native_request)
+    
+    response = client.invoke_model_with_response_stream(modelId=model_id, body=request)
     
-    response = client.invoke_model(modelId=model_id, body=request)
-    model_response = json.loads(response["body"].read())
-    response_text = model_response["content"][0]["text"]
+    fragments: List[str] = []
+    for event in response["body"]:
+        chunk = event.get("chunk")
+        if not chunk:
+            continue
+        
+        model_event = _event_loads(chunk["bytes"])
+        if model_event.get("type") != "content_block_delta":
+            continue
+        
+        # Skip non-text deltas (e.g. input_json_delta, thinking) and empty text
+        delta = model_event.get("delta", {})
+        text = delta.get("text")
+        if delta.get("type", "text_delta") != "text_delta" or not text:
+            continue
+        
+        fragments.append(text)
+        if stream_callback:
+            stream_callback(text)
     
-    return response_text
+    return "".join(fragments)
 
 
 def upload_to_s3(bucket: str, key: str, content: str, region: str = "us-east-1") -> str:
@@ -128,11 +235,28 @@ def upload_to_s3(bucket: str, key: str, content: str, region: str = "us-east-1")
     Raises:
         ClientError: If S3 upload fails
     """
-    client = AWSClients().get_s3_client(region)
+    client = aws_clients.get_s3_client(region)
     client.put_object(Bucket=bucket, Key=key, Body=content)
     return f"s3://{bucket}/{key}"
 
 
+def upload_to_s3_async(bucket: str, key: str, content: str, region: str = "us-east-1") -> Future[str]:
+    """
+    Upload content to S3 in a background thread.
+    
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        content: Content to upload
+        region: AWS region
+        
+    Returns:
+        Future resolving to the S3 path (s3://bucket/key); result() raises
+        ClientError if the upload fails
+    """
+    return _UPLOAD_POOL.submit(upload_to_s3, bucket, key, content, region)
+
+
 def download_from_s3(bucket: str, key: str, region: str = "us-east-1") -> str:
     """
     Download content from S3.
@@ -148,9 +272,64 @@ def download_from_s3(bucket: str, key: str, region: str = "us-east-1") -> str:
     Raises:
         ClientError: If S3 download fails
     """
-    client = AWSClients().get_s3_client(region)
+    return "".join(download_from_s3_streaming(bucket, key, region))
+
+
+def download_from_s3_streaming(
+    bucket: str,
+    key: str,
+    region: str = "us-east-1",
+    chunk_size: int = 65536
+) -> Iterator[str]:
+    """
+    Stream content from S3 as decoded text chunks.
+    
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        region: AWS region
+        chunk_size: Number of bytes to read per chunk
+        
+    Returns:
+        Iterator of UTF-8 decoded string chunks
+        
+    Raises:
+        ClientError: If S3 download fails (on first iteration)
+    """
+    client = aws_clients.get_s3_client(region)
+    response = client.get_object(Bucket=bucket, Key=key)
+    
+    # Incremental decoder handles multi-byte characters split across chunks
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in response["Body"].iter_chunks(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def download_json_from_s3(bucket: str, key: str, region: str = "us-east-1") -> Any:
+    """
+    Download and parse a JSON object from S3.
+    
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        region: AWS region
+        
+    Returns:
+        Parsed JSON content
+        
+    Raises:
+        ClientError: If S3 download fails
+    """
+    client = aws_clients.get_s3_client(region)
     response = client.get_object(Bucket=bucket, Key=key)
-    return response["Body"].read().decode("utf-8")
+    # Parse the raw bytes directly, skipping an intermediate str copy
+    return json.loads(response["Body"].read())
 
 
 def invoke_lambda(
@@ -172,20 +351,12 @@ def invoke_lambda(
     Raises:
         ClientError: If Lambda invocation fails
     """
-    # Use custom config with longer read timeout for long-running Lambda functions
-    # Glue Executor can take 80-130 seconds, so we need at least 180 seconds
-    lambda_config = BotocoreConfig(
-        read_timeout=900,  # 15 minutes - matches Lambda max timeout
-        connect_timeout=10,
-        retries={'max_attempts': 1, 'mode': 'standard'}  # No retries
-    )
-    
-    client = boto3.client('lambda', region_name=region, config=lambda_config)
+    client = aws_clients.get_long_lambda_client(region)
     
     response = client.invoke(
         FunctionName=function_name,
         InvocationType="RequestResponse",
-        Payload=json.dumps(payload)
+        Payload=_json_dumps(payload)
     )
     
     response_payload = json.loads(response["Payload"].read())
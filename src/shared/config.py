@@ -5,27 +5,30 @@ Loads configuration from AWS Secrets Manager.
 import json
 from typing import Dict, Any, Optional
 from botocore.exceptions import ClientError
-from .aws_clients import AWSClients
+from .aws_clients import aws_clients
 
 
 class Config:
     """Configuration manager that loads from Secrets Manager."""
     
-    _instance = None
     _config: Optional[Dict[str, Any]] = None
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
-    
-    def load(self, secret_name: str = "datamorph/config", region: str = "us-east-1") -> Dict[str, Any]:
+    def load(
+        self,
+        secret_name: str = "datamorph/config",
+        region: str = "us-east-1",
+        force_reload: bool = False
+    ) -> Dict[str, Any]:
         """
         Load configuration from Secrets Manager.
         
+        The result is kept in memory for the life of the process (a warm
+        Lambda container reuses it across invocations).
+        
         Args:
             secret_name: Name of the secret in Secrets Manager
             region: AWS region
+            force_reload: Fetch the secret again even if already loaded
             
         Returns:
             Configuration dictionary
@@ -33,10 +36,10 @@ class Config:
         Raises:
             ClientError: If secret cannot be retrieved
         """
-        if self._config is not None:
+        if self._config is not None and not force_reload:
             return self._config
         
-        client = AWSClients().get_secrets_manager_client(region)
+        client = aws_clients.get_secrets_manager_client(region)
         
         try:
             response = client.get_secret_value(SecretId=secret_name)
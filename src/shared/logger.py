@@ -1,14 +1,26 @@
 """
 Shared logging utility for DataMorph.
 Formats log entries consistently and provides helper functions.
+
+Typed entries are built with format_log(LogType.X, **kwargs), driven by the
+_LOG_TEMPLATES table; the format_*_log functions are thin wrappers over it.
 """
-from datetime import datetime
-from typing import Dict, Any, Optional
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from enum import Enum
+from .aws_clients import aws_clients
+from .config import config
+from .utils import is_retryable_error, retry_with_backoff
+
+_log = logging.getLogger(__name__)
 
 
-class LogType(Enum):
-    """Log entry types."""
+class LogType(str, Enum):
+    """Log entry types. Members are strings, so they serialize and compare as their value."""
     STATUS = "status"
     CODE = "code"
     INFO = "info"
@@ -30,6 +42,14 @@ class LogType(Enum):
     TEST_CASES_EXECUTED = "test_cases_executed"
     VALIDATION_PHASE_COMPLETED = "validation_phase_completed"
     REMEDIATION_COMPLETED = "remediation_completed"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with millisecond precision and a Z suffix."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
 
 
 def create_log_entry(
@@ -51,8 +71,8 @@ def create_log_entry(
         Formatted log entry dictionary
     """
     entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "type": log_type.value if isinstance(log_type, LogType) else log_type,
+        "timestamp": _utc_timestamp(),
+        "type": log_type,
         "title": title,
         "description": description
     }
@@ -63,6 +83,224 @@ def create_log_entry(
     return entry
 
 
+# Each template maps the arguments of a format_*_log function to (title, description, metadata)
+_LogParts = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+def _error_template(error: Exception, context: str = "") -> _LogParts:
+    """Build parts for an ERROR entry (see format_error_log)."""
+    return (
+        f"Error: {type(error).__name__}",
+        f"{context}: {str(error)}" if context else str(error),
+        {
+            "error_type": type(error).__name__,
+            "error_message": str(error)
+        }
+    )
+
+
+def _status_template(status: str, message: str, metadata: Optional[Dict[str, Any]] = None) -> _LogParts:
+    """Build parts for a STATUS entry (see format_status_log)."""
+    return f"Status: {status}", message, metadata
+
+
+def _start_template(component: str, details: str = "") -> _LogParts:
+    """Build parts for a START entry (see format_start_log)."""
+    return f"Starting {component}", details or f"{component} execution started", None
+
+
+def _end_template(component: str, details: str = "", metadata: Optional[Dict[str, Any]] = None) -> _LogParts:
+    """Build parts for an END entry (see format_end_log)."""
+    return f"Completed {component}", details or f"{component} execution completed", metadata
+
+
+def _specs_generated_template(specs: Dict[str, Any], s3_path: str) -> _LogParts:
+    """Build parts for a SPECS_GENERATED entry (see format_specs_generated_log)."""
+    return (
+        "Specifications Generated Successfully",
+        f"ETL specifications have been generated and stored at {s3_path}",
+        {
+            "generated_item": specs,
+            "path": s3_path,
+            "source_tables": specs.get("source_tables", []),
+            "target_table": specs.get("target_table", ""),
+            "transformation_count": len(specs.get("transformations", []))
+        }
+    )
+
+
+def _glue_code_generated_template(glue_code: str, s3_path: str, specs_summary: Optional[Dict[str, Any]] = None) -> _LogParts:
+    """Build parts for a GLUE_CODE_GENERATED entry (see format_glue_code_generated_log)."""
+    metadata = {
+        "generated_item": glue_code,
+        "path": s3_path,
+        "code_length": len(glue_code),
+        "lines_of_code": glue_code.count('\n') + (0 if glue_code.endswith('\n') else 1)
+    }
+    
+    if specs_summary:
+        metadata.update(specs_summary)
+    
+    return (
+        "Glue Code Generated Successfully",
+        f"PySpark transformation code has been generated and stored at {s3_path}",
+        metadata
+    )
+
+
+def _glue_execution_completed_template(job_name: str, job_run_id: str, status: str, duration_seconds: Optional[int] = None) -> _LogParts:
+    """Build parts for a GLUE_EXECUTION_COMPLETED entry (see format_glue_execution_completed_log)."""
+    metadata = {
+        "job_name": job_name,
+        "job_run_id": job_run_id,
+        "status": status
+    }
+    
+    if duration_seconds:
+        metadata["duration_seconds"] = duration_seconds
+        metadata["duration_formatted"] = f"{duration_seconds // 60}m {duration_seconds % 60}s"
+    
+    return (
+        "Glue Job Execution Completed",
+        f"Glue job '{job_name}' completed with status: {status}",
+        metadata
+    )
+
+
+def _test_cases_generated_template(test_cases: Dict[str, Any], phase: str, s3_path: str) -> _LogParts:
+    """Build parts for a TEST_CASES_GENERATED entry (see format_test_cases_generated_log)."""
+    return (
+        f"Test Cases Generated Successfully ({phase})",
+        f"Validation test cases for {phase} have been generated and stored at {s3_path}",
+        {
+            "generated_item": test_cases,
+            "path": s3_path,
+            "phase": phase,
+            "test_count": len(test_cases.get("tests", [])) if isinstance(test_cases, dict) else 0
+        }
+    )
+
+
+def _query_generated_template(query: str, test_name: str, query_type: str = "validation") -> _LogParts:
+    """Build parts for a QUERY_GENERATED entry (see format_query_generated_log)."""
+    return (
+        "SQL Query Generated Successfully",
+        f"{query_type.capitalize()} query generated for test: {test_name}",
+        {
+            "generated_item": query,
+            "test_name": test_name,
+            "query_type": query_type,
+            "query_length": len(query)
+        }
+    )
+
+
+def _query_executed_template(query: str, result: Any, test_name: str, passed: bool) -> _LogParts:
+    """Build parts for a QUERY_EXECUTED entry (see format_query_executed_log)."""
+    return (
+        "Query Executed Successfully",
+        f"Query for test '{test_name}' executed - Result: {'PASS' if passed else 'FAIL'}",
+        {
+            "query": query,
+            "result": result,
+            "test_name": test_name,
+            "passed": passed
+        }
+    )
+
+
+def _test_cases_executed_template(results: Dict[str, Any], phase: str, passed_count: int, failed_count: int) -> _LogParts:
+    """Build parts for a TEST_CASES_EXECUTED entry (see format_test_cases_executed_log)."""
+    total = passed_count + failed_count
+    pass_rate = (passed_count / total * 100) if total > 0 else 0
+    
+    return (
+        f"Test Cases Executed Successfully ({phase})",
+        f"Executed {total} tests - {passed_count} passed, {failed_count} failed ({pass_rate:.1f}% pass rate)",
+        {
+            "phase": phase,
+            "total_tests": total,
+            "passed": passed_count,
+            "failed": failed_count,
+            "pass_rate": round(pass_rate, 2),
+            "results": results
+        }
+    )
+
+
+def _validation_phase_completed_template(phase: str, status: str, results_path: str, summary: Dict[str, Any]) -> _LogParts:
+    """Build parts for a VALIDATION_PHASE_COMPLETED entry (see format_validation_phase_completed_log)."""
+    return (
+        f"Validation {phase} Completed",
+        f"Validation {phase} completed with status: {status.upper()}",
+        {
+            "phase": phase,
+            "status": status,
+            "results_path": results_path,
+            **summary
+        }
+    )
+
+
+def _remediation_completed_template(iteration: int, status: str, changes_made: Optional[Dict[str, Any]] = None) -> _LogParts:
+    """Build parts for a REMEDIATION_COMPLETED entry (see format_remediation_completed_log)."""
+    metadata = {
+        "iteration": iteration,
+        "status": status
+    }
+    
+    if changes_made:
+        metadata["changes_made"] = changes_made
+    
+    return (
+        f"Remediation Iteration {iteration} Completed",
+        f"Remediation iteration {iteration} completed with status: {status}",
+        metadata
+    )
+
+
+_LOG_TEMPLATES: Dict[LogType, Callable[..., _LogParts]] = {
+    LogType.ERROR: _error_template,
+    LogType.STATUS: _status_template,
+    LogType.START: _start_template,
+    LogType.END: _end_template,
+    LogType.SPECS_GENERATED: _specs_generated_template,
+    LogType.GLUE_CODE_GENERATED: _glue_code_generated_template,
+    LogType.GLUE_EXECUTION_COMPLETED: _glue_execution_completed_template,
+    LogType.TEST_CASES_GENERATED: _test_cases_generated_template,
+    LogType.QUERY_GENERATED: _query_generated_template,
+    LogType.QUERY_EXECUTED: _query_executed_template,
+    LogType.TEST_CASES_EXECUTED: _test_cases_executed_template,
+    LogType.VALIDATION_PHASE_COMPLETED: _validation_phase_completed_template,
+    LogType.REMEDIATION_COMPLETED: _remediation_completed_template,
+}
+
+
+def format_log(log_type: LogType, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Format a log entry of the given type from its template.
+    
+    Args:
+        log_type: Type of log entry (LogType member or its string value)
+        **kwargs: Arguments of the matching format_*_log function
+        
+    Returns:
+        Formatted log entry
+        
+    Raises:
+        ValueError: If log_type is unknown or has no template
+    """
+    template = _LOG_TEMPLATES.get(log_type)
+    if template is None:
+        supported = ", ".join(lt.value for lt in _LOG_TEMPLATES)
+        raise ValueError(
+            f"No log template for type '{log_type}'; supported types: {supported}"
+        )
+    
+    title, description, metadata = template(**kwargs)
+    return create_log_entry(log_type, title, description, metadata=metadata)
+
+
 def format_error_log(error: Exception, context: str = "") -> Dict[str, Any]:
     """
     Format an error as a log entry.
@@ -74,15 +312,7 @@ def format_error_log(error: Exception, context: str = "") -> Dict[str, Any]:
     Returns:
         Formatted error log entry
     """
-    return create_log_entry(
-        LogType.ERROR,
-        f"Error: {type(error).__name__}",
-        f"{context}: {str(error)}" if context else str(error),
-        metadata={
-            "error_type": type(error).__name__,
-            "error_message": str(error)
-        }
-    )
+    return format_log(LogType.ERROR, error=error, context=context)
 
 
 def format_status_log(status: str, message: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -97,12 +327,7 @@ def format_status_log(status: str, message: str, metadata: Optional[Dict[str, An
     Returns:
         Formatted status log entry
     """
-    return create_log_entry(
-        LogType.STATUS,
-        f"Status: {status}",
-        message,
-        metadata=metadata
-    )
+    return format_log(LogType.STATUS, status=status, message=message, metadata=metadata)
 
 
 def format_start_log(component: str, details: str = "") -> Dict[str, Any]:
@@ -116,11 +341,7 @@ def format_start_log(component: str, details: str = "") -> Dict[str, Any]:
     Returns:
         Formatted start log entry
     """
-    return create_log_entry(
-        LogType.START,
-        f"Starting {component}",
-        details or f"{component} execution started"
-    )
+    return format_log(LogType.START, component=component, details=details)
 
 
 def format_end_log(component: str, details: str = "", metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -135,12 +356,7 @@ def format_end_log(component: str, details: str = "", metadata: Optional[Dict[st
     Returns:
         Formatted end log entry
     """
-    return create_log_entry(
-        LogType.END,
-        f"Completed {component}",
-        details or f"{component} execution completed",
-        metadata=metadata
-    )
+    return format_log(LogType.END, component=component, details=details, metadata=metadata)
 
 
 def format_specs_generated_log(specs: Dict[str, Any], s3_path: str) -> Dict[str, Any]:
@@ -154,18 +370,7 @@ def format_specs_generated_log(specs: Dict[str, Any], s3_path: str) -> Dict[str,
     Returns:
         Formatted log entry
     """
-    return create_log_entry(
-        LogType.SPECS_GENERATED,
-        "Specifications Generated Successfully",
-        f"ETL specifications have been generated and stored at {s3_path}",
-        metadata={
-            "generated_item": specs,
-            "path": s3_path,
-            "source_tables": specs.get("source_tables", []),
-            "target_table": specs.get("target_table", ""),
-            "transformation_count": len(specs.get("transformations", []))
-        }
-    )
+    return format_log(LogType.SPECS_GENERATED, specs=specs, s3_path=s3_path)
 
 
 def format_glue_code_generated_log(glue_code: str, s3_path: str, specs_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -180,22 +385,7 @@ def format_glue_code_generated_log(glue_code: str, s3_path: str, specs_summary:
     Returns:
         Formatted log entry
     """
-    metadata = {
-        "generated_item": glue_code,
-        "path": s3_path,
-        "code_length": len(glue_code),
-        "lines_of_code": len(glue_code.split('\n'))
-    }
-    
-    if specs_summary:
-        metadata.update(specs_summary)
-    
-    return create_log_entry(
-        LogType.GLUE_CODE_GENERATED,
-        "Glue Code Generated Successfully",
-        f"PySpark transformation code has been generated and stored at {s3_path}",
-        metadata=metadata
-    )
+    return format_log(LogType.GLUE_CODE_GENERATED, glue_code=glue_code, s3_path=s3_path, specs_summary=specs_summary)
 
 
 def format_glue_execution_completed_log(job_name: str, job_run_id: str, status: str, duration_seconds: Optional[int] = None) -> Dict[str, Any]:
@@ -211,22 +401,7 @@ def format_glue_execution_completed_log(job_name: str, job_run_id: str, status:
     Returns:
         Formatted log entry
     """
-    metadata = {
-        "job_name": job_name,
-        "job_run_id": job_run_id,
-        "status": status
-    }
-    
-    if duration_seconds:
-        metadata["duration_seconds"] = duration_seconds
-        metadata["duration_formatted"] = f"{duration_seconds // 60}m {duration_seconds % 60}s"
-    
-    return create_log_entry(
-        LogType.GLUE_EXECUTION_COMPLETED,
-        "Glue Job Execution Completed",
-        f"Glue job '{job_name}' completed with status: {status}",
-        metadata=metadata
-    )
+    return format_log(LogType.GLUE_EXECUTION_COMPLETED, job_name=job_name, job_run_id=job_run_id, status=status, duration_seconds=duration_seconds)
 
 
 def format_test_cases_generated_log(test_cases: Dict[str, Any], phase: str, s3_path: str) -> Dict[str, Any]:
@@ -241,17 +416,7 @@ def format_test_cases_generated_log(test_cases: Dict[str, Any], phase: str, s3_p
     Returns:
         Formatted log entry
     """
-    return create_log_entry(
-        LogType.TEST_CASES_GENERATED,
-        f"Test Cases Generated Successfully ({phase})",
-        f"Validation test cases for {phase} have been generated and stored at {s3_path}",
-        metadata={
-            "generated_item": test_cases,
-            "path": s3_path,
-            "phase": phase,
-            "test_count": len(test_cases.get("tests", [])) if isinstance(test_cases, dict) else 0
-        }
-    )
+    return format_log(LogType.TEST_CASES_GENERATED, test_cases=test_cases, phase=phase, s3_path=s3_path)
 
 
 def format_query_generated_log(query: str, test_name: str, query_type: str = "validation") -> Dict[str, Any]:
@@ -266,17 +431,7 @@ def format_query_generated_log(query: str, test_name: str, query_type: str = "va
     Returns:
         Formatted log entry
     """
-    return create_log_entry(
-        LogType.QUERY_GENERATED,
-        f"SQL Query Generated Successfully",
-        f"{query_type.capitalize()} query generated for test: {test_name}",
-        metadata={
-            "generated_item": query,
-            "test_name": test_name,
-            "query_type": query_type,
-            "query_length": len(query)
-        }
-    )
+    return format_log(LogType.QUERY_GENERATED, query=query, test_name=test_name, query_type=query_type)
 
 
 def format_query_executed_log(query: str, result: Any, test_name: str, passed: bool) -> Dict[str, Any]:
@@ -292,17 +447,7 @@ def format_query_executed_log(query: str, result: Any, test_name: str, passed: b
     Returns:
         Formatted log entry
     """
-    return create_log_entry(
-        LogType.QUERY_EXECUTED,
-        f"Query Executed Successfully",
-        f"Query for test '{test_name}' executed - Result: {'PASS' if passed else 'FAIL'}",
-        metadata={
-            "query": query,
-            "result": result,
-            "test_name": test_name,
-            "passed": passed
-        }
-    )
+    return format_log(LogType.QUERY_EXECUTED, query=query, result=result, test_name=test_name, passed=passed)
 
 
 def format_test_cases_executed_log(results: Dict[str, Any], phase: str, passed_count: int, failed_count: int) -> Dict[str, Any]:
@@ -318,22 +463,7 @@ def format_test_cases_executed_log(results: Dict[str, Any], phase: str, passed_c
     Returns:
         Formatted log entry
     """
-    total = passed_count + failed_count
-    pass_rate = (passed_count / total * 100) if total > 0 else 0
-    
-    return create_log_entry(
-        LogType.TEST_CASES_EXECUTED,
-        f"Test Cases Executed Successfully ({phase})",
-        f"Executed {total} tests - {passed_count} passed, {failed_count} failed ({pass_rate:.1f}% pass rate)",
-        metadata={
-            "phase": phase,
-            "total_tests": total,
-            "passed": passed_count,
-            "failed": failed_count,
-            "pass_rate": round(pass_rate, 2),
-            "results": results
-        }
-    )
+    return format_log(LogType.TEST_CASES_EXECUTED, results=results, phase=phase, passed_count=passed_count, failed_count=failed_count)
 
 
 def format_validation_phase_completed_log(phase: str, status: str, results_path: str, summary: Dict[str, Any]) -> Dict[str, Any]:
@@ -349,17 +479,7 @@ def format_validation_phase_completed_log(phase: str, status: str, results_path:
     Returns:
         Formatted log entry
     """
-    return create_log_entry(
-        LogType.VALIDATION_PHASE_COMPLETED,
-        f"Validation {phase} Completed",
-        f"Validation {phase} completed with status: {status.upper()}",
-        metadata={
-            "phase": phase,
-            "status": status,
-            "results_path": results_path,
-            **summary
-        }
-    )
+    return format_log(LogType.VALIDATION_PHASE_COMPLETED, phase=phase, status=status, results_path=results_path, summary=summary)
 
 
 def format_remediation_completed_log(iteration: int, status: str, changes_made: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -374,17 +494,202 @@ def format_remediation_completed_log(iteration: int, status: str, changes_made:
     Returns:
         Formatted log entry
     """
-    metadata = {
-        "iteration": iteration,
-        "status": status
-    }
+    return format_log(LogType.REMEDIATION_COMPLETED, iteration=iteration, status=status, changes_made=changes_made)
+
+
+def _to_dynamodb_value(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a Python object to DynamoDB's type-annotated attribute format.
     
-    if changes_made:
-        metadata["changes_made"] = changes_made
+    Args:
+        obj: Value to convert
+        
+    Returns:
+        Typed attribute value (e.g. {"S": "hello"}, {"M": {...}})
+    """
+    if obj is None:
+        return {"NULL": True}
+    elif isinstance(obj, bool):
+        # Must check bool before int (bool is subclass of int)
+        return {"BOOL": obj}
+    elif isinstance(obj, (int, float)):
+        return {"N": str(obj)}
+    elif isinstance(obj, str):
+        return {"S": obj}
+    elif isinstance(obj, dict):
+        # Attribute names must be strings; coerce keys like json.dumps does
+        return {"M": {str(k): _to_dynamodb_value(v) for k, v in obj.items()}}
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        return {"L": [_to_dynamodb_value(item) for item in obj]}
+    else:
+        return {"S": str(obj)}
+
+
+class LogBuffer:
+    """
+    In-process buffer that batches log entries before writing to DynamoDB.
     
-    return create_log_entry(
-        LogType.REMEDIATION_COMPLETED,
-        f"Remediation Iteration {iteration} Completed",
-        f"Remediation iteration {iteration} completed with status: {status}",
-        metadata=metadata
-    )
+    All entries for a run live in a single item's ``logs`` list, so each
+    flush issues one list_append UpdateItem per run_id rather than one
+    request per entry. BatchWriteItem is not used because its PutRequest
+    would overwrite the whole run item instead of appending to it.
+    
+    Lambda handlers should call flush() before returning, since a frozen
+    container does not run atexit hooks.
+    
+    Entries rejected with a non-retryable error (e.g. ValidationException,
+    or a client-side ParamValidationError) are dropped and logged. Entries
+    that fail with a throttling, transient or network error are put back at
+    the front of the buffer, which is capped at max_pending entries.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 25,
+        flush_interval: float = 5.0,
+        max_pending: int = 1000
+    ):
+        """
+        Args:
+            max_entries: Flush once this many entries are buffered
+            flush_interval: Flush on append if this many seconds have passed
+                since the last flush
+            max_pending: Maximum entries kept when re-queuing failed writes;
+                the oldest are dropped beyond this
+        """
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._buf: List[Tuple[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        # Serializes writes so a run's entries reach list_append in order
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+    
+    def append(self, run_id: str, entry: Dict[str, Any]) -> None:
+        """
+        Buffer a log entry for a run, flushing if the buffer is full or stale.
+        
+        Write failures are logged, never raised, so logging cannot break
+        the workflow.
+        
+        Args:
+            run_id: Run the entry belongs to
+            entry: Log entry (see create_log_entry)
+        """
+        with self._lock:
+            self._buf.append((run_id, entry))
+            should_flush = (
+                len(self._buf) >= self.max_entries
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        
+        if should_flush:
+            self._flush_quietly()
+    
+    def flush(self) -> None:
+        """
+        Write all buffered entries to DynamoDB.
+        
+        Every run is attempted even if an earlier one fails.
+        
+        Raises:
+            Exception: The last write error, after all runs were attempted
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buf = self._buf, []
+                self._last_flush = time.monotonic()
+            
+            if not batch:
+                return
+            
+            # Group by run, preserving entry order within each run
+            by_run: Dict[str, List[Dict[str, Any]]] = {}
+            for run_id, entry in batch:
+                by_run.setdefault(run_id, []).append(entry)
+            
+            requeue: List[Tuple[str, Dict[str, Any]]] = []
+            last_error: Optional[Exception] = None
+            for run_id, entries in by_run.items():
+                try:
+                    retry_with_backoff(lambda: self._write(run_id, entries))
+                except Exception as e:
+                    last_error = e
+                    if is_retryable_error(e):
+                        requeue.extend((run_id, entry) for entry in entries)
+                    else:
+                        # Isolate the bad entry so the rest of the run is kept
+                        requeue.extend(
+                            (run_id, entry)
+                            for entry in self._write_individually(run_id, entries)
+                        )
+            
+            if requeue:
+                with self._lock:
+                    self._buf[:0] = requeue
+                    overflow = len(self._buf) - self.max_pending
+                    if overflow > 0:
+                        del self._buf[:overflow]
+                        _log.error("Log buffer full, dropped %d oldest entries", overflow)
+        
+        if last_error is not None:
+            raise last_error
+    
+    def _flush_quietly(self) -> None:
+        """Flush, logging instead of raising any write error."""
+        try:
+            self.flush()
+        except Exception as e:
+            _log.warning("Failed to flush log entries to DynamoDB: %s", e)
+    
+    def _write_individually(self, run_id: str, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Write entries one at a time after a batch was rejected.
+        
+        Entries rejected with a non-retryable error are dropped and logged.
+        
+        Returns:
+            Entries that failed transiently and should be re-queued
+        """
+        transient: List[Dict[str, Any]] = []
+        for entry in entries:
+            if transient:
+                # Keep order: once one entry is deferred, defer the rest too
+                transient.append(entry)
+                continue
+            try:
+                self._write(run_id, [entry])
+            except Exception as e:
+                if is_retryable_error(e):
+                    transient.append(entry)
+                else:
+                    _log.error(
+                        "Dropped log entry for run %s (%s): %s",
+                        run_id, entry.get("title", ""), e
+                    )
+        return transient
+    
+    def _write(self, run_id: str, entries: List[Dict[str, Any]]) -> None:
+        """Append entries to a run's logs list in a single UpdateItem call."""
+        dynamodb = aws_clients.get_dynamodb_client(config.aws_region)
+        now = _utc_timestamp()
+        
+        dynamodb.update_item(
+            TableName=config.dynamodb_table,
+            Key={config.dynamodb_partition_key: {"S": run_id}},
+            UpdateExpression=(
+                "SET logs = list_append(if_not_exists(logs, :empty_list), :new_logs), "
+                "created_at = if_not_exists(created_at, :now), updated_at = :now"
+            ),
+            ExpressionAttributeValues={
+                ":new_logs": _to_dynamodb_value(entries),
+                ":empty_list": {"L": []},
+                ":now": {"S": now}
+            }
+        )
+
+
+# Global log buffer, flushed at interpreter exit so tail entries aren't lost
+log_buffer = LogBuffer()
+atexit.register(log_buffer._flush_quietly)
@@ -1,25 +1,87 @@
 """
 Shared utility functions for DataMorph.
 """
+import random
+import re
+import secrets
 import time
-import uuid
-from datetime import datetime
 from typing import Callable, Any, Optional
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_]+")
+
+# botocore network failures: connection errors and connect/read timeouts
+NETWORK_ERRORS = (HTTPClientError, BotocoreConnectionError)
+
+# AWS error codes worth retrying: botocore's standard-mode throttling and
+# transient codes plus Bedrock's transient errors. Stored lower-case because
+# event-stream errors (e.g. from invoke_model_with_response_stream) report
+# lower-camel member names such as "throttlingException".
+_RETRYABLE_ERROR_CODES = frozenset(code.lower() for code in (
+    # Throttling
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "EC2ThrottledException",
+    # Transient
+    "RequestTimeout",
+    "RequestTimeoutException",
+    "PriorRequestNotComplete",
+    "ServiceUnavailable",
+    "InternalServerError",
+    # Bedrock
+    "ServiceUnavailableException",
+    "InternalServerException",
+    "ModelTimeoutException",
+    "ModelNotReadyException",
+))
 
 
 def generate_run_id() -> str:
     """
-    Generate a unique run ID using timestamp and UUID.
+    Generate a unique run ID using a UTC timestamp and 32 random bits.
     
     Returns:
-        Unique run ID string
+        Unique run ID string (YYYYMMDD_HHMMSS_xxxxxxxx)
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    unique_id = secrets.token_hex(4)
     return f"{timestamp}_{unique_id}"
 
 
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Check whether an AWS error is a throttling, transient or network error.
+    
+    Args:
+        error: Exception raised by a boto3 call
+        
+    Returns:
+        True if the call is worth retrying
+    """
+    if isinstance(error, NETWORK_ERRORS):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+    
+    code = error.response.get("Error", {}).get("Code") or ""
+    if code.lower() in _RETRYABLE_ERROR_CODES:
+        return True
+    
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+    return status >= 500
+
+
 def retry_with_backoff(
     func: Callable,
     max_attempts: int = 3,
@@ -28,7 +90,11 @@ def retry_with_backoff(
     exponential_base: float = 2.0
 ) -> Any:
     """
-    Retry a function with exponential backoff.
+    Retry a function with jittered exponential backoff.
+    
+    Throttling, transient and 5xx ClientErrors and network errors are
+    retried (see is_retryable_error); any other exception is raised
+    immediately.
     
     Args:
         func: Function to retry
@@ -41,23 +107,28 @@ def retry_with_backoff(
         Result from successful function call
         
     Raises:
-        Exception: Last exception if all attempts fail
+        ClientError: Last retryable error if all attempts fail (or the
+            last network error from NETWORK_ERRORS)
+        Exception: The first non-retryable error
     """
     last_exception = None
     
     for attempt in range(max_attempts):
         try:
             return func()
-        except (ClientError, Exception) as e:
+        except (ClientError, *NETWORK_ERRORS) as e:
+            if not is_retryable_error(e):
+                raise
+            
             last_exception = e
             
             # Don't retry on last attempt
             if attempt == max_attempts - 1:
                 break
             
-            # Calculate delay with exponential backoff
+            # Full jitter so concurrent callers don't retry in lockstep
             delay = min(base_delay * (exponential_base ** attempt), max_delay)
-            time.sleep(delay)
+            time.sleep(random.uniform(0, delay))
     
     raise last_exception
 
@@ -75,14 +146,15 @@ def parse_s3_path(s3_path: str) -> tuple[str, str]:
     Raises:
         ValueError: If path format is invalid
     """
-    if not s3_path.startswith("s3://"):
+    prefix, scheme, rest = s3_path.partition("s3://")
+    if prefix or not scheme:
         raise ValueError(f"Invalid S3 path format: {s3_path}")
     
-    path_parts = s3_path[5:].split("/", 1)
-    if len(path_parts) != 2:
+    bucket, sep, key = rest.partition("/")
+    if not sep or not bucket or not key:
         raise ValueError(f"Invalid S3 path format: {s3_path}")
     
-    return path_parts[0], path_parts[1]
+    return bucket, key
 
 
 def sanitize_table_name(name: str) -> str:
@@ -95,8 +167,8 @@ def sanitize_table_name(name: str) -> str:
     Returns:
         Sanitized table name
     """
-    # Remove any characters that aren't alphanumeric or underscore
-    sanitized = "".join(c for c in name if c.isalnum() or c == "_")
+    # Remove any characters that aren't ASCII alphanumeric or underscore
+    sanitized = _SANITIZE_RE.sub("", name)
     
     # Ensure it doesn't start with a number
     if sanitized and sanitized[0].isdigit():